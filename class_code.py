@@ -1,7 +1,19 @@
+import bisect
+import collections
+import itertools
 import numpy as np
+import queue
+import struct
+import threading
+import zlib
 #import time
 
 class Neighbourhood:
+    # rough cost of one prefix sum along an axis and of the diagonal prefix sums
+    # of a 2 dimensional diamond, counted in additions of a shifted board
+    runningcost = 20
+    diagonalcost = 70
+
     def __init__(self, reladresses : list) -> None:
         '''
         creates an instance of the class
@@ -75,6 +87,132 @@ class Neighbourhood:
             raise ValueError('the dimension of the new adress doesn\'t match the old one')
         self.neighbours[index] = val
         
+    def radius(self) -> int:
+        '''
+        returns the largest distance of a neighbour along any axis
+
+        Returns
+        -------
+        int
+            the radius of the neighbourhood.
+
+        '''
+        return max([max([abs(coordinate) for coordinate in reladress]) for reladress in self.neighbours])
+
+    def windows(self, padded : np.array, width : int) -> np.array:
+        '''
+        gives the states of the neighbours of all cells of a padded board at once
+
+        Parameters
+        ----------
+        padded : np.array
+            the states of the cells, surrounded by a halo.
+        width : int
+            the width of the halo, at least the radius of the neighbourhood.
+
+        Raises
+        ----------
+        ValueError
+            The halo needs to be at least as wide as the radius.
+
+        Returns
+        -------
+        np.array
+            array with the states of the n-th neighbour of every cell at index n,
+                the cells are those of the board without the halo.
+
+        '''
+        if width < self.radius():
+            raise ValueError('the halo is narrower than the radius of the neighbourhood')
+        shape = [length - 2 * width for length in padded.shape]
+        windows = np.empty([len(self.neighbours)] + shape, padded.dtype)
+        for number in range(len(self.neighbours)):
+            windows[number] = self.window(padded, width, number)
+        return windows
+
+    def window(self, padded : np.array, width : int, number : int) -> np.array:
+        '''
+        gives the states of one neighbour of all cells of a padded board at once
+
+        Parameters
+        ----------
+        padded : np.array
+            the states of the cells, surrounded by a halo.
+        width : int
+            the width of the halo, at least the radius of the neighbourhood.
+        number : int
+            the number of the neighbour.
+
+        Returns
+        -------
+        np.array
+            the states of the neighbour of every cell of the board without the halo.
+
+        '''
+        reladress = self.neighbours[number]
+        return padded[tuple([slice(width + reladress[i], padded.shape[i] - width + reladress[i]) for i in range(padded.ndim)])]
+
+    def totals(self, padded : np.array, width : int) -> np.array:
+        '''
+        adds up the states of the neighbours of all cells of a padded board at once
+
+        Parameters
+        ----------
+        padded : np.array
+            the states of the cells, surrounded by a halo.
+        width : int
+            the width of the halo, at least the radius of the neighbourhood.
+
+        Returns
+        -------
+        np.array
+            the sum of the states of the neighbours of every cell of the board without the halo.
+
+        '''
+        if width < self.radius():
+            raise ValueError('the halo is narrower than the radius of the neighbourhood')
+        totals = np.zeros([length - 2 * width for length in padded.shape], np.int32)
+        for number in range(len(self.neighbours)):
+            totals += self.window(padded, width, number)
+        return totals
+
+    @staticmethod
+    def runningsum(array : np.array, axis : int, width : int, length : int) -> np.array:
+        '''
+        adds up the states of the cells at most length cells away along one axis.
+            Short ranges are added directly, longer ones using a prefix sum so
+            the cost doesn't depend on length
+
+        Parameters
+        ----------
+        array : np.array
+            the states of the cells, surrounded by a halo along the axis.
+        axis : int
+            the axis along which is added.
+        width : int
+            the width of the halo, at least length.
+        length : int
+            the largest distance of the cells that are added.
+
+        Returns
+        -------
+        np.array
+            the sums for the cells without the halo.
+
+        '''
+        axis = axis % array.ndim
+        cells = array.shape[axis] - 2 * width
+        if 2 * length + 1 <= Neighbourhood.runningcost:
+            totals = array[(slice(None),) * axis + (slice(width - length, width - length + cells),)].copy()
+            for shift in range(1 - length, length + 1):
+                totals += array[(slice(None),) * axis + (slice(width + shift, width + shift + cells),)]
+            return totals
+        prefix = np.zeros(array.shape[:axis] + (array.shape[axis] + 1,) + array.shape[axis + 1:], np.int64)
+        np.cumsum(array, axis, out = prefix[(slice(None),) * axis + (slice(1, None),)])
+        upper = (slice(None),) * axis + (slice(width + length + 1, width + length + 1 + cells),)
+        lower = (slice(None),) * axis + (slice(width - length, width - length + cells),)
+        return prefix[upper] - prefix[lower]
+
     def __len__(self) -> int:
         '''
         returns the number of neighbours
@@ -208,6 +346,113 @@ class Edgerule:
             forwardadress = [(adress[i] + offsetcomp[i]*(adress[zeroindex]//shape[zeroindex])) % shape[i] for i in range(len(adress))]
             return False, tuple(forwardadress)
 
+    def resolve(self, adresses : tuple, shape : tuple) -> tuple:
+        '''
+        determines the 'real' adresses of many cells at once,
+            the array version of calling the instance
+
+        Parameters
+        ----------
+        adresses : tuple
+            one integer array per dimension with the coordinates of the cells,
+                the arrays are broadcast against each other.
+        shape : tuple
+            shape of the board.
+
+        Raises
+        ----------
+        ValueError
+            The dimension of adresses and board need to match
+                and there needs to be a 0 in the offsets
+
+        Returns
+        -------
+        tuple
+
+        first element = boolean array, True where the constant is to be used.
+        second element = tuple of arrays with the 'real' adresses of the cells,
+            cells that use the constant get a valid but meaningless adress.
+
+        '''
+        if len(adresses) != len(shape):
+            raise ValueError('the adresses don\'t have as many dimensions as the board')
+        adresses = np.broadcast_arrays(*[np.asarray(coords) for coords in adresses])
+        if self.kind == 'D':
+            inside = np.ones(adresses[0].shape, bool)
+            for i in range(len(shape)):
+                inside &= (0 <= adresses[i]) & (adresses[i] < shape[i])
+            forwardadress = tuple([np.clip(adresses[i], 0, shape[i] - 1) for i in range(len(shape))])
+            return ~inside, forwardadress
+        constant = np.zeros(adresses[0].shape, bool)
+        if self.kind == 'N':
+            forwardadress = tuple([np.clip(adresses[i], 0, shape[i] - 1) for i in range(len(shape))])
+            return constant, forwardadress
+        offsetcomp = list(self.offset)
+        if len(shape) > len(self.offset):
+            offsetcomp += [0] * (len(shape) - len(self.offset))
+        else:
+            offsetcomp = offsetcomp[:len(shape)]
+        if 0 not in offsetcomp:
+            raise ValueError('there is no 0 in the relevant offsets')
+        zeroindex = offsetcomp.index(0)
+        turns = adresses[zeroindex] // shape[zeroindex]
+        forwardadress = tuple([(adresses[i] + offsetcomp[i] * turns) % shape[i] for i in range(len(shape))])
+        return constant, forwardadress
+
+    def take(self, cells : np.array, adresses : tuple) -> np.array:
+        '''
+        gives the states of many cells at once, also outside of the board
+
+        Parameters
+        ----------
+        cells : np.array
+            the states of the cells of the board.
+        adresses : tuple
+            one integer array per dimension with the coordinates of the cells,
+                the arrays are broadcast against each other.
+
+        Returns
+        -------
+        np.array
+            the states of the cells, with the broadcast shape of the adresses.
+
+        '''
+        constant, forwardadress = self.resolve(adresses, cells.shape)
+        states = cells[forwardadress]
+        if constant.any():
+            states[constant] = self.const
+        return states
+
+    def pad(self, cells : np.array, width) -> np.array:
+        '''
+        surrounds the board with a halo of cells following the boundary condition
+
+        Parameters
+        ----------
+        cells : np.array
+            the states of the cells of the board.
+        width : int or list
+            the width of the halo, either one integer for all sides,
+                or a (before, after) pair for every dimension.
+
+        Raises
+        ----------
+        ValueError
+            The width cannot be negative.
+
+        Returns
+        -------
+        np.array
+            the board including the halo.
+
+        '''
+        if type(width) == int:
+            width = [(width, width)] * cells.ndim
+        if any([before < 0 or after < 0 for before, after in width]):
+            raise ValueError('the halo cannot have a negative width')
+        adresses = np.ix_(*[np.arange(-width[i][0], cells.shape[i] + width[i][1]) for i in range(cells.ndim)])
+        return self.take(cells, adresses)
+
     def __str__(self) -> str:
         '''
         returns a readable description of the instance
@@ -237,8 +482,201 @@ class Edgerule:
         '''
         return f'edgerule({self.type}, {self.constant}, {self.offset}'
 
+class Cache:
+    def __init__(self, size : int = None, eviction : str = None) -> None:
+        '''
+        creates an instance of this class, a bounded memory of the results
+            of a next state function
+
+        Parameters
+        ----------
+        size : int, optional
+            the largest number of results that are remembered. The default is 65536.
+        eviction : str, optional
+            determines wether the least recently used ('lru') or the least
+                frequently used ('lfu') result is forgotten first. The default is 'lru'.
+
+        Raises
+        ------
+        ValueError
+            size needs to be positive and eviction needs to be 'lru' or 'lfu'.
+
+        Returns
+        -------
+        None.
+
+        '''
+        if size == None:
+            size = 2 ** 16
+        if size < 1:
+            raise ValueError('a cache must be able to remember at least one result')
+        if eviction == None:
+            eviction = 'lru'
+        if eviction not in ['lru', 'lfu']:
+            raise ValueError('the eviction must be either \'lru\' or \'lfu\'')
+        self.size = size
+        self.eviction = eviction
+        self.clear()
+
+    def clear(self) -> None:
+        '''
+        forgets all results and resets the statistics
+
+        Returns
+        -------
+        None
+
+        '''
+        self.results = {}
+        self.order = collections.OrderedDict()
+        self.counts = {}
+        self.buckets = collections.defaultdict(collections.OrderedDict)
+        self.least = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key : tuple) -> bool:
+        '''
+        determines whether a result is remembered, without counting it as a use
+
+        Parameters
+        ----------
+        key : tuple
+            the states of the neighbours.
+
+        Returns
+        -------
+        bool
+            whether the result is remembered.
+
+        '''
+        return key in self.results
+
+    def __getitem__(self, key : tuple):
+        '''
+        gives a remembered result and counts it as a hit or a miss
+
+        Parameters
+        ----------
+        key : tuple
+            the states of the neighbours.
+
+        Raises
+        ----------
+        KeyError
+            The result is not remembered.
+
+        Returns
+        -------
+        any type
+            the remembered result.
+
+        '''
+        if key not in self.results:
+            self.misses += 1
+            raise KeyError(key)
+        self.hits += 1
+        if self.eviction == 'lru':
+            self.order.move_to_end(key)
+        else:
+            count = self.counts[key]
+            del self.buckets[count][key]
+            if not self.buckets[count]:
+                del self.buckets[count]
+                if self.least == count:
+                    self.least = count + 1
+            self.counts[key] = count + 1
+            self.buckets[count + 1][key] = None
+        return self.results[key]
+
+    def __setitem__(self, key : tuple, val) -> None:
+        '''
+        remembers a result, forgetting another one when the cache is full
+
+        Parameters
+        ----------
+        key : tuple
+            the states of the neighbours.
+        val : any type
+            the result of the next state function.
+
+        Returns
+        -------
+        None
+
+        '''
+        if key in self.results:
+            self.results[key] = val
+            return
+        if len(self.results) >= self.size:
+            if self.eviction == 'lru':
+                oldest, _ = self.order.popitem(last = False)
+            else:
+                oldest, _ = self.buckets[self.least].popitem(last = False)
+                if not self.buckets[self.least]:
+                    del self.buckets[self.least]
+                del self.counts[oldest]
+            del self.results[oldest]
+            self.evictions += 1
+        self.results[key] = val
+        if self.eviction == 'lru':
+            self.order[key] = None
+        else:
+            self.counts[key] = 1
+            self.buckets[1][key] = None
+            self.least = 1
+
+    def __len__(self) -> int:
+        '''
+        returns the number of remembered results
+
+        Returns
+        -------
+        int
+            the number of remembered results
+
+        '''
+        return len(self.results)
+
+    def info(self) -> dict:
+        '''
+        gives the statistics of the cache
+
+        Returns
+        -------
+        dict
+            the hits, misses, evictions, number of remembered results and size.
+
+        '''
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'length': len(self.results), 'size': self.size}
+
+    def __str__(self) -> str:
+        '''
+        returns a readable description of the instance
+
+        Returns
+        -------
+        str
+            the readable description.
+
+        '''
+        return f'{self.eviction} cache of size {self.size}, {self.hits} hits and {self.misses} misses'
+
+    def __repr__(self) -> str:
+        '''
+        returns a complete representation of the instance
+
+        Returns
+        -------
+        str
+            the complete representation.
+
+        '''
+        return f'cache({self.size}, {self.eviction})'
+
 class Rule:
-    def __init__(self, neighbourhood : Neighbourhood, f = None) -> None:
+    def __init__(self, neighbourhood : Neighbourhood, f = None, cache : int = None, eviction : str = None) -> None:
         '''
         creates a new instance of this class
 
@@ -246,18 +684,29 @@ class Rule:
         ----------
 
         neighbourhood : Neighbourhood
-            the neighbourhood of a generic cell.
+            the neighbourhood of a generic cell, a list of relative adresses
+                is turned into a Neighbourhood.
         f : any type
             function which takes a list of states of the neighbours,
                 and returns the next state. (nextstatefunction)
+        cache : int, optional
+            the number of results of f that are remembered. The default is
+                None, in which case no results are remembered.
+        eviction : str, optional
+            'lru' or 'lfu', which remembered result is forgotten first when
+                the cache is full. The default is 'lru'.
         
         Returns
         -------
         None.
 
         '''
+        if not isinstance(neighbourhood, Neighbourhood):
+            neighbourhood = Neighbourhood(list(neighbourhood))
         self.neighbourhood = neighbourhood
         self.f = f
+        self.cache = Cache(cache, eviction) if cache else None
+        self.quiescence = {}
 
     def __call__(self, neighbours:tuple) -> int:
         '''
@@ -288,69 +737,231 @@ class Rule:
             raise TypeError('The state of any neighbour is always an numpy.int32')
         if self.f == None:
             raise ValueError('the next state function has not been defined')
-        return self.f(neighbours)
+        return self.lookup(neighbours)
 
-    def __str__(self) -> str:
+    def lookup(self, neighbours : tuple):
         '''
-        returns a readable description of the instance
+        calls the next state function, or gives the remembered result when
+            the rule has a cache
+
+        Parameters
+        ----------
+        neighbours : tuple
+            list of states of the neighbours.
 
         Returns
         -------
-        str
-            the readable description.
+        any type
+            the result of the next state function.
 
         '''
-        return f'rule using function {self.f} and neighbourhood {self.neighbourhood}'
+        if self.cache == None:
+            return self.f(neighbours)
+        try:
+            return self.cache[neighbours]
+        except KeyError:
+            result = self.f(neighbours)
+            self.cache[neighbours] = result
+            return result
 
-    def __repr__(self) -> str:
+    def evaluate(self, neighbours : np.array) -> np.array:
         '''
-        returns a complete representation of the instance
+        calls the next state function for many cells at once. The function is
+            called only once for every configuration of neighbours that occurs,
+            and the results are copied to all cells with that configuration.
+
+        Parameters
+        ----------
+        neighbours : np.array
+            array with the states of the n-th neighbour of every cell at index n.
+
+        Raises
+        ----------
+        ValueError
+            The number of neighbours needs to match with the neighbourhood of the rule
+                and the next state function must be defined.
 
         Returns
         -------
-        str
-            the complete representation.
+        np.array
+            the results of the next state function, with the shape of the cells in front.
 
         '''
-        return f'rule({self.f},{self.neighbourhood})'
+        if len(neighbours) != len(self.neighbourhood):
+            raise ValueError('The number of neighbours doesn\'t match with the neighbourhood of the rule')
+        if self.f == None:
+            raise ValueError('the next state function has not been defined')
+        shape = neighbours.shape[1:]
+        configurations = neighbours.reshape(len(neighbours), -1).T.astype(np.int32)
+        if not len(configurations):
+            return np.zeros(shape, np.int32)
+        low = configurations.min()
+        base = int(configurations.max()) - int(low) + 1
+        if base ** len(neighbours) < 2 ** 63:
+            codes = (configurations - low).astype(np.int64) @ (base ** np.arange(len(neighbours), dtype = np.int64))
+            _, first, inverse = np.unique(codes, return_index = True, return_inverse = True)
+            unique = configurations[first]
+        else:
+            unique, inverse = np.unique(configurations, axis = 0, return_inverse = True)
+        results = np.array([self.lookup(tuple(configuration)) for configuration in unique])
+        return results[inverse.ravel()].reshape(shape + results.shape[1:])
 
-class Board:
-    def __init__(self, matrix : np.array, edgerules : Edgerule) -> None:
+    def apply(self, neighbours : np.array) -> np.array:
         '''
-        creates an instance of this class
+        determines the next states of many cells at once
 
         Parameters
         ----------
-        matrix : np.array
-            array which contains the states of the cells.
-        edgerules : Edgerule
-            the boundary condition for this instance.
-   
-        Raises
+        neighbours : np.array
+            array with the states of the n-th neighbour of every cell at index n.
+
+        Returns
+        -------
+        np.array
+            the next states of the cells.
+
+        '''
+        return self.evaluate(neighbours).astype(np.int32)
+
+    def evolve(self, padded : np.array, width : int) -> np.array:
+        '''
+        determines the next states of all cells of a padded board at once
+
+        Parameters
         ----------
-        TypeError
-            All cells of the matrix need to be integers.
-        
+        padded : np.array
+            the states of the cells, surrounded by a halo.
+        width : int
+            the width of the halo, at least the radius of the neighbourhood.
+
         Returns
         -------
-        None.
+        np.array
+            the next states of the cells of the board without the halo.
 
         '''
-        if matrix.dtype != np.int32:
-            raise TypeError('all cells must have integer type')
-        
-        self.edgerules = edgerules
-        self.cells = matrix
+        return self.apply(self.neighbourhood.windows(padded, width))
 
-    def neighbourhood(self, index : tuple, reladresses : Neighbourhood) -> list:
+    def quiescent(self, state : int) -> bool:
         '''
-        function for determining the states of the neighbours
+        determines whether a cell surrounded by cells in a state stays in that state.
+            The next state function is called directly, bypassing the cache, and
+            only once for every state; when it fails the state counts as not quiescent.
 
         Parameters
         ----------
-        index : tuple
-            the adress of the cell.
-        adresses : Neighbourhood
+        state : int
+            the state of the cell and its neighbours.
+
+        Returns
+        -------
+        bool
+            whether the state is quiescent.
+
+        '''
+        key = (self.f, state)
+        if key not in self.quiescence:
+            try:
+                self.quiescence[key] = bool(self.stays(self.f(tuple([np.int32(state)] * len(self.neighbourhood))), state))
+            except Exception:
+                self.quiescence[key] = False
+        return self.quiescence[key]
+
+    def stays(self, result, state : int) -> bool:
+        '''
+        determines whether a result of the next state function keeps a cell in its state
+
+        Parameters
+        ----------
+        result : any type
+            the result of the next state function.
+        state : int
+            the state of the cell.
+
+        Returns
+        -------
+        bool
+            whether the cell stays in the state.
+
+        '''
+        return result == state
+
+    def __str__(self) -> str:
+        '''
+        returns a readable description of the instance
+
+        Returns
+        -------
+        str
+            the readable description.
+
+        '''
+        return f'rule using function {self.f} and neighbourhood {self.neighbourhood}'
+
+    def __repr__(self) -> str:
+        '''
+        returns a complete representation of the instance
+
+        Returns
+        -------
+        str
+            the complete representation.
+
+        '''
+        return f'rule({self.f},{self.neighbourhood})'
+
+class Board:
+    def __init__(self, matrix : np.array, edgerules : Edgerule, grow : bool = None) -> None:
+        '''
+        creates an instance of this class
+
+        Parameters
+        ----------
+        matrix : np.array
+            array which contains the states of the cells.
+        edgerules : Edgerule
+            the boundary condition for this instance.
+        grow : bool, optional
+            whether a Dirichlet board grows when a pattern reaches its border,
+                instead of treating the border as a wall. The default is False.
+                The attribute origin holds the adress, in the coordinates of the
+                original matrix, of the first cell cells[0, ...] of the grown board.
+                It starts at (0, ..., 0) and becomes negative when the board grows
+                before its first cell, so the original first cell is at -origin.
+   
+        Raises
+        ----------
+        TypeError
+            All cells of the matrix need to be integers.
+
+        ValueError
+            Only a Dirichlet board can grow.
+        
+        Returns
+        -------
+        None.
+
+        '''
+        if matrix.dtype != np.int32:
+            raise TypeError('all cells must have integer type')
+        if grow and edgerules.kind != 'D':
+            raise ValueError('only a board with a Dirichlet boundary can grow')
+        
+        self.edgerules = edgerules
+        self.cells = matrix
+        self.generation = 0
+        self.grow = bool(grow)
+        self.origin = (0,) * matrix.ndim
+
+    def neighbourhood(self, index : tuple, reladresses : Neighbourhood) -> list:
+        '''
+        function for determining the states of the neighbours
+
+        Parameters
+        ----------
+        index : tuple
+            the adress of the cell.
+        adresses : Neighbourhood
             the 'list' of relative adresses.
    
         Raises
@@ -380,7 +991,7 @@ class Board:
             absadress = [index[i] + reladress[i] for i in range(len(index))]
             constant, val = self.edgerules(absadress, self.cells.shape)
             if constant:
-                neighbour = val
+                neighbour = np.int32(val)
             else:
                 neighbour = self.cells[val]
             neighbours += [neighbour]
@@ -389,7 +1000,8 @@ class Board:
     def nextstate(self, nextstatefunc : Rule = None) -> None:
         '''
         determines the next state of the board using the nextstatefunction,
-            and changes the board to that state
+            and changes the board to that state. On a Dirichlet board with a
+            quiescent rule only the cells near the pattern are computed.
 
         Parameters
         ----------
@@ -408,6 +1020,9 @@ class Board:
         '''
         if not nextstatefunc:
             raise ValueError('a rule must be specified. Are you missing an argument?')
+        if self.croppable(nextstatefunc):
+            self.cropstate(nextstatefunc, self.bounds())
+            return
         nextboard = np.zeros(self.cells.shape,np.int32)
         adressbook = nextstatefunc.neighbourhood
         for index in np.ndenumerate(self.cells):
@@ -415,6 +1030,7 @@ class Board:
             nextboard[index[0]] = nextstatefunc(neighbours)
             
         self.cells = nextboard
+        self.generation += 1
         
     def advance(self, rule : Rule = None, steps : int = None) -> None:
         '''
@@ -443,245 +1059,2093 @@ class Board:
             steps = 1
         if steps < 1:
             raise ValueError('You cannot make me go backwards, that goes against the second law of thermodynamics')
+        if self.croppable(rule):
+            box = self.bounds()
+            for step in range(steps):
+                box = self.cropstate(rule, box, step > 0)
+            return
         for _ in range(steps):
             self.nextstate(rule)
-    
-    def __getitem__(self, index :tuple ) -> int:
+
+    def croppable(self, rule : Rule) -> bool:
         '''
-        gives the state of a cell
+        determines whether only the cells near the pattern need to be computed,
+            which is the case on a Dirichlet board when the rule keeps cells
+            surrounded by the constant at the constant
 
         Parameters
         ----------
-        index : tuple
-            the adress of the cell.
+        rule : Rule
+            the rule with which the next states of the board are to be determined.
 
         Returns
         -------
-        int
-            the state of the cell.
+        bool
+            whether the board can be cropped.
 
         '''
-        return self.cells[index]
-    
-    def __setitem__(self, index: tuple, val: int) -> None:
+        return self.edgerules.kind == 'D' and rule.quiescent(self.edgerules.const)
+
+    def bounds(self, lo : tuple = None, hi : tuple = None) -> tuple:
         '''
-        sets the value of a cell
+        determines the smallest box that contains all cells that differ
+            from the constant of the boundary
 
         Parameters
         ----------
-        index : tuple
-            the adress of the cell.
-        val : int
-            the new state of the cell.
+        lo : tuple, optional
+            the adress of the first cell of the part of the board that is searched.
+                The default is the first cell of the board.
+        hi : tuple, optional
+            the adress just past the last cell of the part of the board that is searched.
+                The default is the shape of the board.
 
         Returns
         -------
-        None
+        tuple
+            the adress of the first cell of the box and the adress just past
+                its last cell, or None when all cells equal the constant.
+
+        '''
+        if lo == None:
+            lo = (0,) * self.cells.ndim
+        if hi == None:
+            hi = self.cells.shape
+        active = self.cells[tuple([slice(lo[i], hi[i]) for i in range(self.cells.ndim)])] != self.edgerules.const
+        first = []
+        last = []
+        for axis in range(self.cells.ndim):
+            occupied = np.flatnonzero(active.any(tuple([other for other in range(self.cells.ndim) if other != axis])))
+            if not len(occupied):
+                return None
+            first += [lo[axis] + int(occupied[0])]
+            last += [lo[axis] + int(occupied[-1]) + 1]
+        return tuple(first), tuple(last)
+
+    def cropstate(self, rule : Rule, box : tuple, owned : bool = None) -> tuple:
+        '''
+        determines the next state of the board by computing only the cells
+            within the radius of the neighbourhood from the box, and changes the
+            board to that state. The other cells of the new board are filled
+            with the constant, unless the board owns its array, in which case
+            only the region is overwritten. A growing board is enlarged when needed.
 
-        '''
-        self.cells[index]=val
-        
-    def __str__(self) -> str:
-        '''
-        returns a readable description of the instance
+        Parameters
+        ----------
+        rule : Rule
+            the rule with which the next states of the board are to be determined.
+        box : tuple
+            the box that contains all cells that differ from the constant,
+                as given by bounds.
+        owned : bool, optional
+            whether self.cells was made by an earlier cropstate of the same
+                advance, so that nobody else refers to it. The default is False.
 
         Returns
         -------
-        str
-            the readable description.
-
-        '''
-        return str(self.cells)
+        tuple
+            the box for the next state.
+
+        '''
+        self.generation += 1
+        if box == None:
+            return None
+        width = rule.neighbourhood.radius()
+        lo = [box[0][i] - width for i in range(self.cells.ndim)]
+        hi = [box[1][i] + width for i in range(self.cells.ndim)]
+        if self.grow:
+            lo, hi = self.reserve(lo, hi)
+        shape = self.cells.shape
+        lo = tuple([max(lo[i], 0) for i in range(len(shape))])
+        hi = tuple([min(hi[i], shape[i]) for i in range(len(shape))])
+        states = self.region(rule, lo, hi, 1)
+        if not owned:
+            self.cells = np.full(shape, self.edgerules.const, np.int32)
+        self.cells[tuple([slice(lo[i], hi[i]) for i in range(len(shape))])] = states
+        return self.bounds(lo, hi)
+
+    def reserve(self, lo : list, hi : list) -> tuple:
+        '''
+        enlarges the board so that it contains the box from lo to hi,
+            by at least half its length on every side that is too small
+            so that a growing pattern only rarely needs a new array
 
-    def __repr__(self) -> str:
-        '''
-        returns a complete representation of the instance
+        Parameters
+        ----------
+        lo : list
+            the adress of the first cell of the box, which may lie outside the board.
+        hi : list
+            the adress just past the last cell of the box.
 
         Returns
         -------
-        str
-            the complete representation.
+        tuple
+            lo and hi, as adresses on the enlarged board. origin is updated to
+                the original coordinates of the new first cell.
 
         '''
-        return f'{self.edgerules},\n board({self.cells})'
+        shape = self.cells.shape
+        before = [max(-lo[i], 0) for i in range(len(shape))]
+        after = [max(hi[i] - shape[i], 0) for i in range(len(shape))]
+        if not any(before) and not any(after):
+            return lo, hi
+        before = [max(before[i], shape[i] // 2) if before[i] else 0 for i in range(len(shape))]
+        after = [max(after[i], shape[i] // 2) if after[i] else 0 for i in range(len(shape))]
+        cells = np.full([before[i] + shape[i] + after[i] for i in range(len(shape))], self.edgerules.const, np.int32)
+        cells[tuple([slice(before[i], before[i] + shape[i]) for i in range(len(shape))])] = self.cells
+        self.cells = cells
+        self.origin = tuple([self.origin[i] - before[i] for i in range(len(shape))])
+        return [lo[i] + before[i] for i in range(len(shape))], [hi[i] + before[i] for i in range(len(shape))]
 
-class Emptyboard(Board):
-    def __init__(self, dimensions : tuple, edgerules: Edgerule) -> None:
+    def blockstate(self, blockrule : 'Blockrule' = None) -> None:
         '''
-        creates an instance of this class
+        determines the next state of the board using margolus partitioning,
+            and changes the board to that state. The blocks are shifted by one
+            cell in every direction on odd generations.
 
         Parameters
         ----------
-        dimensions : tuple
-            the dimensions of the new board.
-        edgerules : Edgerule
-            the boundary conditions for this new board.
-        
+        blockrule : Blockrule
+            the rule with which the next states of the blocks are to be determined.
+
         Raises
         ----------
         ValueError
-            The length of the dimensions need to be positive.
-        
-        TypeError
-           The dimensions need to be integers
-           
+            blockrule needs to be specified, its dimension needs to match the board
+                and a wrapping board needs an even amount of cells in every direction.
+
         Returns
         -------
-        None.
+        None
 
         '''
-        if any([length<= 0  for length in dimensions]):
-            raise ValueError('you cannot use non-positive lengths for any dimensions')
-        if any([type(length)!= int for length in dimensions]):
-            raise TypeError('all dimensions for a board must be integers')
-        cells = np.zeros(dimensions, np.int32)
-        super().__init__(cells, edgerules)
+        if not blockrule:
+            raise ValueError('a block rule must be specified. Are you missing an argument?')
+        if blockrule.dim != self.cells.ndim:
+            raise ValueError('the dimension of the block rule doesn\'t match that of the board')
+        shape = self.cells.shape
+        wrap = self.edgerules.kind == 'wrap'
+        if wrap and any([length % 2 for length in shape]):
+            raise ValueError('a wrapping board needs an even amount of cells in every direction for margolus blocks')
+        phase = self.generation % 2
+        if wrap:
+            counts = shape
+        else:
+            counts = tuple([length + phase + (length + phase) % 2 for length in shape])
+        adresses = np.ix_(*[np.arange(-phase, count - phase) for count in counts])
+        states = self.edgerules.take(self.cells, adresses)
+        dim = self.cells.ndim
+        split = []
+        for count in counts:
+            split += [count // 2, 2]
+        order = list(range(0, 2 * dim, 2)) + list(range(1, 2 * dim, 2))
+        blocks = states.reshape(split).transpose(order).reshape(-1, 2 ** dim)
+        newblocks = blockrule.apply(blocks)
+        newstates = newblocks.reshape([split[i] for i in order]).transpose(np.argsort(order)).reshape(counts)
+        if wrap:
+            _, forwardadress = self.edgerules.resolve(adresses, shape)
+            nextboard = np.empty(shape, np.int32)
+            nextboard[forwardadress] = newstates
+        else:
+            nextboard = np.ascontiguousarray(newstates[tuple([slice(phase, phase + length) for length in shape])])
+        self.cells = nextboard
+        self.generation += 1
 
-class Totalistic(Rule):
-    def __init__(self, neighbourhood : Neighbourhood, birth : set, live : set) -> None:
+    def blockadvance(self, blockrule : 'Blockrule' = None, steps : int = None) -> None:
         '''
-        creates an instance of this class
+        takes multiple margolus steps at once
 
         Parameters
         ----------
-        neighbourhood : Neighbourhood
-            the relative adresses of the neighbours of a generic cell.
-        birth : set
-            list of number of live neighbours for which the current cell will turn alive.
-        live : set
-            list of number of live neighbours for which the current cell will stay alive.
-        
+        blockrule : Blockrule
+            the rule with which the next states of the blocks are to be determined.
+        steps : int, optional
+            the number of steps to be taken. The default is 1
+
         Raises
         ----------
         ValueError
-            The amount of living neighbours needs to be positive 
-                and the amount of living neighbours cannot proceed the amount of neighbours
-        
-        TypeError
-            The amount of living neighbours needs to be an integer.
-           
+            blockrule must be specified and steps cannot be lower than 1.
+
         Returns
         -------
         None.
 
         '''
-        if any([total < 0 for total in birth]):
-            raise ValueError('you cannot have a negative amount of living neighbours')
-        if any([total > len(neighbourhood) for total in birth]):
-            raise ValueError('you cannot have more living neighbours than you have neighbours')
-        if any([type(total) != int for total in birth]):
-            raise TypeError('you cannot have a non-integer amount of living neighbours')
-        if any([total < 0 for total in live]):
-            raise ValueError('you cannot have a negative amount of living neighbours')
-        if any([total > len(neighbourhood) for total in live]):
-            raise ValueError('you cannot have more living neighbours than you have neighbours')
-        if any([type(total) != int for total in live]):
-            raise TypeError('you cannot have a non-integer amount of living neighbours')
-        self.birth = birth
-        self.live = live
-        def f(neighbours : list)->int:
-            '''
-            returns the next state of a cell based on a list of states of the neighbours
-            
-            Parameters
-            ----------
-            
-            neighbours : list
-                list of states of the neighbours of a cell
-        
-            Raises
-            ----------
-            ValueError
-                The number of neighbours needs to match the size of the neighbourhood.
-        
-            TypeError
-                The state of a cell needs to be a 0 or 1.
-           
-            Returns
-            -------
-                int
-                    next state of the cell
-            '''
-            if len(neighbours) != len(neighbourhood):
-                raise ValueError('the number of neighbours doesn\'t match with the size of the neighbourhood')
-            if any([neighbour not in [0,1] for neighbour in neighbours]):
-                raise TypeError('the state of any cell can only be 0 or 1 with a totalistic rule')
-            birth = neighbours[0] == 0 and sum(neighbours) in self.birth
-            live = neighbours[0] == 1 and sum(neighbours) - 1 in self.live
-            if birth or live:
-                return 1
-            return 0
-        super().__init__(neighbourhood,f)
-        
-
-    def __str__(self) -> str:
+        if not blockrule:
+            raise ValueError('a block rule must be specified. Are you missing an argument?')
+        if not steps:
+            steps = 1
+        if steps < 1:
+            raise ValueError('You cannot make me go backwards, that goes against the second law of thermodynamics')
+        for _ in range(steps):
+            self.blockstate(blockrule)
+    
+    def neighbourarrays(self, index : tuple, reladresses : Neighbourhood) -> np.array:
         '''
-        returns a readable description of the instance
-
-        Returns
-        -------
-        str
-            the readable description.
+        function for determining the states of the neighbours of many cells at once
 
-        '''
-        return f"totalistic rule B{','.join([str(i) for i in self.birth])}/S{','.join([str(i) for i in self.live])} with neighbourhood {self.neighbourhood}"
+        Parameters
+        ----------
+        index : tuple
+            one integer array per dimension with the adresses of the cells.
+        reladresses : Neighbourhood
+            the 'list' of relative adresses.
 
-    def __repr__(self) -> str:
-        '''
-        returns a complete representation of the instance
+        Raises
+        ----------
+        ValueError
+            The dimension of the adresses, the neighbours and the board need to match.
 
         Returns
         -------
-        str
-            the complete representation.
+        np.array
+            array with the states of the n-th neighbour of every cell at index n.
 
         '''
-        return f"totalistic(B{','.join([str(i) for i in self.birth])}/S{','.join([str(i) for i in self.live])}, {self.neighbourhood})"
+        if len(index) != self.cells.ndim:
+            raise ValueError('the number of dimensions of the adresses don\'t match up with that of the board')
+        if len(reladresses[0]) != self.cells.ndim:
+            raise ValueError('the number of dimensions of the neighbours adresses don\'t match up with that of the board')
+        index = np.broadcast_arrays(*[np.asarray(coords) for coords in index])
+        neighbours = np.empty((len(reladresses),) + index[0].shape, np.int32)
+        for number, reladress in enumerate(reladresses):
+            absadress = tuple([index[i] + reladress[i] for i in range(len(index))])
+            neighbours[number] = self.edgerules.take(self.cells, absadress)
+        return neighbours
 
-class Moorehood(Neighbourhood):
-    def __init__(self, dim : int = None, length : int = None) -> None:
+    def nextcells(self, rule : Rule = None) -> np.array:
         '''
-        creates an instance of this class
+        determines the next states of all cells at once, without changing the board
 
         Parameters
         ----------
-        dim : int, optional
-            The number of dimensions of the neighbourhood. The default is 2.
-        length : int, optional
+        rule : Rule
+            the rule with which the next states of the board are to be determined.
+
+        Raises
+        ----------
+        ValueError
+            rule needs to be specified
+
+        Returns
+        -------
+        np.array
+            the next states of all cells.
+
+        '''
+        if not rule:
+            raise ValueError('a rule must be specified. Are you missing an argument?')
+        width = rule.neighbourhood.radius()
+        return rule.evolve(self.edgerules.pad(self.cells, width), width)
+
+    def totals(self, reladresses : Neighbourhood) -> np.array:
+        '''
+        adds up the states of the neighbours of all cells at once
+
+        Parameters
+        ----------
+        reladresses : Neighbourhood
+            the 'list' of relative adresses.
+
+        Returns
+        -------
+        np.array
+            the sum of the states of the neighbours of every cell.
+
+        '''
+        width = reladresses.radius()
+        return reladresses.totals(self.edgerules.pad(self.cells, width), width)
+
+    def sweep(self, rule : Rule = None, schedule : 'Schedule' = None, steps : int = None) -> None:
+        '''
+        updates the board using an update schedule, every cell gets a chance to
+            update once per step.
+
+        Parameters
+        ----------
+        rule : Rule
+            the rule with which the next states of the board are to be determined.
+        schedule : Schedule, optional
+            the order in which the cells are updated. The default is synchronous.
+        steps : int, optional
+            the number of steps to be taken. The default is 1
+
+        Raises
+        ----------
+        ValueError
+            rule must be specified and steps cannot be lower than 1.
+
+        Returns
+        -------
+        None.
+
+        '''
+        if not rule:
+            raise ValueError('a rule must be specified. Are you missing an argument?')
+        if not schedule:
+            schedule = Schedule()
+        if not steps:
+            steps = 1
+        if steps < 1:
+            raise ValueError('You cannot make me go backwards, that goes against the second law of thermodynamics')
+        for _ in range(steps):
+            schedule(self, rule)
+            self.generation += 1
+
+    def region(self, rule : Rule = None, lo : tuple = None, hi : tuple = None, steps : int = None) -> np.array:
+        '''
+        determines the states of the cells in a rectangular region after a
+            number of steps, without changing the board. Only the region and a
+            halo of steps times the radius of the neighbourhood are computed.
+
+        Parameters
+        ----------
+        rule : Rule
+            the rule with which the next states of the board are to be determined.
+        lo : tuple, optional
+            the adress of the first cell of the region. The default is the first cell of the board.
+        hi : tuple, optional
+            the adress just past the last cell of the region. The default is the shape of the board.
+        steps : int, optional
+            the number of steps to be taken. The default is 1
+
+        Raises
+        ----------
+        ValueError
+            rule must be specified, the region must lie on the board
+                and steps cannot be lower than 0.
+
+        Returns
+        -------
+        np.array
+            the states of the cells in the region, a new array also when steps is 0.
+
+        '''
+        if not rule:
+            raise ValueError('a rule must be specified. Are you missing an argument?')
+        shape = self.cells.shape
+        if lo == None:
+            lo = (0,) * len(shape)
+        if hi == None:
+            hi = shape
+        if len(lo) != len(shape) or len(hi) != len(shape):
+            raise ValueError('the number of dimensions of the region don\'t match up with that of the board')
+        if any([not 0 <= lo[i] < hi[i] <= shape[i] for i in range(len(shape))]):
+            raise ValueError('the region must be a non-empty part of the board')
+        if steps == None:
+            steps = 1
+        if steps < 0:
+            raise ValueError('You cannot make me go backwards, that goes against the second law of thermodynamics')
+        width = rule.neighbourhood.radius()
+        halo = steps * width
+        if self.edgerules.kind == 'wrap':
+            start = [lo[i] - halo for i in range(len(shape))]
+            states = self.edgerules.take(self.cells, np.ix_(*[np.arange(lo[i] - halo, hi[i] + halo) for i in range(len(shape))]))
+            edges = [(False, False)] * len(shape)
+        else:
+            start = [max(lo[i] - halo, 0) for i in range(len(shape))]
+            stop = [min(hi[i] + halo, shape[i]) for i in range(len(shape))]
+            states = self.cells[tuple([slice(start[i], stop[i]) for i in range(len(shape))])]
+            edges = [(start[i] == 0, stop[i] == shape[i]) for i in range(len(shape))]
+        pads = [(width if before else 0, width if after else 0) for before, after in edges]
+        for _ in range(steps):
+            padded = self.edgerules.pad(states, pads) if any([any(pad) for pad in pads]) else states
+            states = rule.evolve(padded, width)
+            start = [start[i] + width - pads[i][0] for i in range(len(shape))]
+        states = states[tuple([slice(lo[i] - start[i], hi[i] - start[i]) for i in range(len(shape))])]
+        if steps == 0:
+            return states.copy()
+        return states
+
+    def tiledadvance(self, rule : Rule = None, steps : int = None, generations : int = None, tile = None, cachesize : int = None) -> None:
+        '''
+        takes multiple steps at once, tile by tile. Every tile is advanced several
+            generations in one go while it is in the cache, which saves memory
+            traffic on boards that are much larger than the cache.
+            Overlapping halos compute the same cells more than once, which would
+            give different random draws for them, so a Stochastic rule is
+            stepped with sweep instead.
+
+        Parameters
+        ----------
+        rule : Rule
+            the rule with which the next states of the board are to be determined.
+        steps : int, optional
+            the number of steps to be taken. The default is 1
+        generations : int, optional
+            the number of generations a tile is advanced in one go.
+                The default is chosen from the tile size.
+        tile : int or tuple, optional
+            the length of a tile in every direction.
+                The default is chosen so that a tile and its halo fit in the cache.
+        cachesize : int, optional
+            the number of bytes of cache a tile may use. The default is 1048576.
+
+        Raises
+        ----------
+        ValueError
+            rule must be specified, steps cannot be lower than 1
+                and generations and tile lengths need to be positive.
+
+        Returns
+        -------
+        None.
+
+        '''
+        if not rule:
+            raise ValueError('a rule must be specified. Are you missing an argument?')
+        if not steps:
+            steps = 1
+        if steps < 1:
+            raise ValueError('You cannot make me go backwards, that goes against the second law of thermodynamics')
+        if isinstance(rule, Stochastic):
+            self.sweep(rule, None, steps)
+            return
+        if not cachesize:
+            cachesize = 2 ** 20
+        shape = self.cells.shape
+        width = max(rule.neighbourhood.radius(), 1)
+        if tile == None:
+            side = (cachesize / (4 * (len(rule.neighbourhood) + 2))) ** (1 / len(shape))
+            tile = max(int(side / 1.5), 1)
+        if type(tile) == int:
+            tile = (tile,) * len(shape)
+        if len(tile) != len(shape):
+            raise ValueError('the number of dimensions of the tile don\'t match up with that of the board')
+        if any([length < 1 for length in tile]):
+            raise ValueError('the tiles must have a positive length in every direction')
+        tile = tuple([min(tile[i], shape[i]) for i in range(len(shape))])
+        if generations == None:
+            generations = max(min(tile) // (16 * width), 1)
+        if generations < 1:
+            raise ValueError('a tile must be advanced at least one generation at a time')
+        while steps > 0:
+            batch = min(generations, steps)
+            nextboard = np.empty(shape, np.int32)
+            for lo in itertools.product(*[range(0, shape[i], tile[i]) for i in range(len(shape))]):
+                hi = tuple([min(lo[i] + tile[i], shape[i]) for i in range(len(shape))])
+                nextboard[tuple([slice(lo[i], hi[i]) for i in range(len(shape))])] = self.region(rule, lo, hi, batch)
+            self.cells = nextboard
+            self.generation += batch
+            steps -= batch
+
+    def probe(self, rule : Rule = None, adresses : list = None, steps : int = None) -> np.array:
+        '''
+        determines the states of some cells after a number of steps, without
+            changing the board. Only the cells that can influence them are
+            computed, a box that shrinks by the radius of the neighbourhood
+            every step. Probes close to each other share one box.
+
+        Parameters
+        ----------
+        rule : Rule
+            the rule with which the next states of the board are to be determined.
+        adresses : list
+            the adresses of the cells.
+        steps : int, optional
+            the number of steps to be taken. The default is 1
+
+        Raises
+        ----------
+        ValueError
+            rule and adresses must be specified, the adresses must lie on the board
+                and steps cannot be lower than 0.
+
+        Returns
+        -------
+        np.array
+            the states of the cells, in the order of the adresses.
+
+        '''
+        if not rule:
+            raise ValueError('a rule must be specified. Are you missing an argument?')
+        if not adresses:
+            raise ValueError('at least one adress must be specified')
+        if steps == None:
+            steps = 1
+        if steps < 0:
+            raise ValueError('You cannot make me go backwards, that goes against the second law of thermodynamics')
+        shape = self.cells.shape
+        if any([len(adress) != len(shape) or any([not 0 <= adress[i] < shape[i] for i in range(len(shape))]) for adress in adresses]):
+            raise ValueError('all adresses must lie on the board')
+        halo = steps * rule.neighbourhood.radius()
+        def volume(lo : list, hi : list) -> int:
+            return int(np.prod([hi[i] - lo[i] + 2 * halo for i in range(len(shape))]))
+        if volume([0] * len(shape), [1] * len(shape)) >= self.cells.size:
+            board = Board(self.cells.copy(), self.edgerules)
+            if steps:
+                board.sweep(rule, None, steps)
+            return np.array([board.cells[tuple(adress)] for adress in adresses], np.int32)
+        groups = []
+        for number, adress in enumerate(adresses):
+            for group in groups:
+                lo = [min(group[0][i], adress[i]) for i in range(len(shape))]
+                hi = [max(group[1][i], adress[i] + 1) for i in range(len(shape))]
+                if volume(lo, hi) <= volume(group[0], group[1]) + volume(adress, [coordinate + 1 for coordinate in adress]):
+                    group[0], group[1] = lo, hi
+                    group[2] += [number]
+                    break
+            else:
+                groups += [[list(adress), [coordinate + 1 for coordinate in adress], [number]]]
+        states = np.empty(len(adresses), np.int32)
+        for lo, hi, numbers in groups:
+            cone = self.region(rule, tuple(lo), tuple(hi), steps)
+            for number in numbers:
+                states[number] = cone[tuple([adresses[number][i] - lo[i] for i in range(len(shape))])]
+        return states
+
+    def __getitem__(self, index :tuple ) -> int:
+        '''
+        gives the state of a cell
+
+        Parameters
+        ----------
+        index : tuple
+            the adress of the cell.
+
+        Returns
+        -------
+        int
+            the state of the cell.
+
+        '''
+        return self.cells[index]
+    
+    def __setitem__(self, index: tuple, val: int) -> None:
+        '''
+        sets the value of a cell
+
+        Parameters
+        ----------
+        index : tuple
+            the adress of the cell.
+        val : int
+            the new state of the cell.
+
+        Returns
+        -------
+        None
+
+        '''
+        self.cells[index]=val
+        
+    def __str__(self) -> str:
+        '''
+        returns a readable description of the instance
+
+        Returns
+        -------
+        str
+            the readable description.
+
+        '''
+        return str(self.cells)
+
+    def __repr__(self) -> str:
+        '''
+        returns a complete representation of the instance
+
+        Returns
+        -------
+        str
+            the complete representation.
+
+        '''
+        return f'{self.edgerules},\n board({self.cells})'
+
+class Emptyboard(Board):
+    def __init__(self, dimensions : tuple, edgerules: Edgerule, grow : bool = None) -> None:
+        '''
+        creates an instance of this class
+
+        Parameters
+        ----------
+        dimensions : tuple
+            the dimensions of the new board.
+        edgerules : Edgerule
+            the boundary conditions for this new board.
+        grow : bool, optional
+            whether a Dirichlet board grows when a pattern reaches its border.
+                The default is False.
+        
+        Raises
+        ----------
+        ValueError
+            The length of the dimensions need to be positive.
+        
+        TypeError
+           The dimensions need to be integers
+           
+        Returns
+        -------
+        None.
+
+        '''
+        if any([length<= 0  for length in dimensions]):
+            raise ValueError('you cannot use non-positive lengths for any dimensions')
+        if any([type(length)!= int for length in dimensions]):
+            raise TypeError('all dimensions for a board must be integers')
+        cells = np.zeros(dimensions, np.int32)
+        super().__init__(cells, edgerules, grow)
+
+class Totalistic(Rule):
+    def __init__(self, neighbourhood : Neighbourhood, birth : set, live : set) -> None:
+        '''
+        creates an instance of this class
+
+        Parameters
+        ----------
+        neighbourhood : Neighbourhood
+            the relative adresses of the neighbours of a generic cell.
+        birth : set
+            list of number of live neighbours for which the current cell will turn alive.
+        live : set
+            list of number of live neighbours for which the current cell will stay alive.
+        
+        Raises
+        ----------
+        ValueError
+            The amount of living neighbours needs to be positive 
+                and the amount of living neighbours cannot proceed the amount of neighbours
+        
+        TypeError
+            The amount of living neighbours needs to be an integer.
+           
+        Returns
+        -------
+        None.
+
+        '''
+        if any([total < 0 for total in birth]):
+            raise ValueError('you cannot have a negative amount of living neighbours')
+        if any([total > len(neighbourhood) for total in birth]):
+            raise ValueError('you cannot have more living neighbours than you have neighbours')
+        if any([type(total) != int for total in birth]):
+            raise TypeError('you cannot have a non-integer amount of living neighbours')
+        if any([total < 0 for total in live]):
+            raise ValueError('you cannot have a negative amount of living neighbours')
+        if any([total > len(neighbourhood) for total in live]):
+            raise ValueError('you cannot have more living neighbours than you have neighbours')
+        if any([type(total) != int for total in live]):
+            raise TypeError('you cannot have a non-integer amount of living neighbours')
+        self.birth = birth
+        self.live = live
+        def f(neighbours : list)->int:
+            '''
+            returns the next state of a cell based on a list of states of the neighbours
+            
+            Parameters
+            ----------
+            
+            neighbours : list
+                list of states of the neighbours of a cell
+        
+            Raises
+            ----------
+            ValueError
+                The number of neighbours needs to match the size of the neighbourhood.
+        
+            TypeError
+                The state of a cell needs to be a 0 or 1.
+           
+            Returns
+            -------
+                int
+                    next state of the cell
+            '''
+            if len(neighbours) != len(neighbourhood):
+                raise ValueError('the number of neighbours doesn\'t match with the size of the neighbourhood')
+            if any([neighbour not in [0,1] for neighbour in neighbours]):
+                raise TypeError('the state of any cell can only be 0 or 1 with a totalistic rule')
+            birth = neighbours[0] == 0 and sum(neighbours) in self.birth
+            live = neighbours[0] == 1 and sum(neighbours) - 1 in self.live
+            if birth or live:
+                return 1
+            return 0
+        super().__init__(neighbourhood,f)
+        
+
+    def apply(self, neighbours : np.array) -> np.array:
+        '''
+        determines the next states of many cells at once by counting the live neighbours
+
+        Parameters
+        ----------
+        neighbours : np.array
+            array with the states of the n-th neighbour of every cell at index n.
+
+        Raises
+        ----------
+        ValueError
+            The number of neighbours needs to match the size of the neighbourhood.
+
+        TypeError
+            The state of a cell needs to be a 0 or 1.
+
+        Returns
+        -------
+        np.array
+            the next states of the cells.
+
+        '''
+        if len(neighbours) != len(self.neighbourhood):
+            raise ValueError('the number of neighbours doesn\'t match with the size of the neighbourhood')
+        if neighbours.size and (neighbours.min() < 0 or neighbours.max() > 1):
+            raise TypeError('the state of any cell can only be 0 or 1 with a totalistic rule')
+        return self.decide(neighbours[0], neighbours.sum(0))
+
+    def evolve(self, padded : np.array, width : int) -> np.array:
+        '''
+        determines the next states of all cells of a padded board at once,
+            using the totals of the neighbourhood
+
+        Parameters
+        ----------
+        padded : np.array
+            the states of the cells, surrounded by a halo.
+        width : int
+            the width of the halo, at least the radius of the neighbourhood.
+
+        Raises
+        ----------
+        TypeError
+            The state of a cell needs to be a 0 or 1.
+
+        Returns
+        -------
+        np.array
+            the next states of the cells of the board without the halo.
+
+        '''
+        if padded.size and (padded.min() < 0 or padded.max() > 1):
+            raise TypeError('the state of any cell can only be 0 or 1 with a totalistic rule')
+        return self.decide(self.neighbourhood.window(padded, width, 0), self.neighbourhood.totals(padded, width))
+
+    def decide(self, centre : np.array, total : np.array) -> np.array:
+        '''
+        determines the next states of many cells at once from their own state
+            and the number of live cells in their neighbourhood, using lookup tables
+
+        Parameters
+        ----------
+        centre : np.array
+            the states of the cells.
+        total : np.array
+            the number of live cells in the neighbourhood of every cell, the cell included.
+
+        Returns
+        -------
+        np.array
+            the next states of the cells.
+
+        '''
+        birth = np.zeros(len(self.neighbourhood) + 2, bool)
+        birth[list(self.birth)] = True
+        live = np.zeros(len(self.neighbourhood) + 2, bool)
+        live[[total + 1 for total in self.live]] = True
+        return np.where(centre == 1, live[total], birth[total]).astype(np.int32)
+
+    def __str__(self) -> str:
+        '''
+        returns a readable description of the instance
+
+        Returns
+        -------
+        str
+            the readable description.
+
+        '''
+        return f"totalistic rule B{','.join([str(i) for i in self.birth])}/S{','.join([str(i) for i in self.live])} with neighbourhood {self.neighbourhood}"
+
+    def __repr__(self) -> str:
+        '''
+        returns a complete representation of the instance
+
+        Returns
+        -------
+        str
+            the complete representation.
+
+        '''
+        return f"totalistic(B{','.join([str(i) for i in self.birth])}/S{','.join([str(i) for i in self.live])}, {self.neighbourhood})"
+
+class Moorehood(Neighbourhood):
+    def __init__(self, dim : int = None, length : int = None) -> None:
+        '''
+        creates an instance of this class
+
+        Parameters
+        ----------
+        dim : int, optional
+            The number of dimensions of the neighbourhood. The default is 2.
+        length : int, optional
             The maximum Chebyshev distance for cells in the neighbourhood.
                 The default is 1.
 
         Raises
-        ------
+        ------
+        ValueError
+            dim cannot be lower than 1, and length cannot be lower than 0.
+
+        Returns
+        -------
+        None
+
+        '''
+        if not dim:
+            dim = 2
+        if dim < 1:
+            raise ValueError
+        if length == None:
+            length = 1
+        if length < 0:
+            raise ValueError
+        self.dim = dim
+        self.length = length
+        neighbours = [[]]
+        for _ in range(dim):
+            for number in range(len(neighbours)):
+                current_house = neighbours[number]
+                neighbours[number] = current_house + [0]
+                for d in range(1, length + 1):
+                    neighbours += [current_house + [d], current_house + [-d]]
+        for number in range(len(neighbours)):
+            neighbours[number] = tuple(neighbours[number])
+        self.original = tuple(neighbours)
+        super().__init__(neighbours)
+
+    def totals(self, padded : np.array, width : int) -> np.array:
+        '''
+        adds up the states of the neighbours of all cells of a padded board at once,
+            with one running sum per axis, so the cost per cell grows with the
+            number of dimensions instead of the number of neighbours
+
+        Parameters
+        ----------
+        padded : np.array
+            the states of the cells, surrounded by a halo.
+        width : int
+            the width of the halo, at least the radius of the neighbourhood.
+
+        Returns
+        -------
+        np.array
+            the sum of the states of the neighbours of every cell of the board without the halo.
+
+        '''
+        if tuple(self.neighbours) != self.original or padded.ndim != self.dim or width < self.length:
+            return super().totals(padded, width)
+        totals = padded
+        for axis in range(self.dim):
+            totals = self.runningsum(totals, axis, width, self.length)
+        return totals.astype(np.int32)
+
+    def __str__(self) -> str:
+        '''
+        returns a readable description of the instance
+
+        Returns
+        -------
+        str
+            the readable description.
+
+        '''
+        return f'moore({self.dim},{self.length})'
+
+class Neumannhood(Neighbourhood):
+    def __init__(self, dim : int = None, length : int = None) -> None:
+        '''
+        creates an instance of this class
+
+        Parameters
+        ----------
+        dim : int, optional
+            The number of dimensions of the neighbourhood. The default is 2.
+        length : int, optional
+            The maximum Manhattan distance of cells in the neighbourhood.
+            The default is 1.
+
+        Raises
+        ------
+        ValueError
+            dim cannot be lower than 1, and length cannot be lower than 0.
+
+
+        Returns
+        -------
+        None.
+
+        '''
+        if not dim:
+            dim = 2
+        if dim < 1:
+            raise ValueError
+        if length == None:
+            length = 1
+        if length < 0:
+            raise ValueError
+        self.dim = dim
+        self.length = length
+        neighbours = [[]]
+        for _ in range(dim):
+            for number in range(len(neighbours)):
+                current_house = neighbours[number]
+                neighbours[number] = current_house + [0]
+                distance = sum([abs(coord) for coord in current_house])
+                for d in range(1, length - distance + 1):
+                    neighbours += [current_house + [d], current_house + [-d]]
+        for number in range(len(neighbours)):
+            neighbours[number] = tuple(neighbours[number])
+        self.original = tuple(neighbours)
+        super().__init__(neighbours)
+
+    def totals(self, padded : np.array, width : int) -> np.array:
+        '''
+        adds up the states of the neighbours of all cells of a padded board at once,
+            using diamondsum when its estimated cost is lower than adding up
+            every neighbour separately.
+
+        Parameters
+        ----------
+        padded : np.array
+            the states of the cells, surrounded by a halo.
+        width : int
+            the width of the halo, at least the radius of the neighbourhood.
+
+        Returns
+        -------
+        np.array
+            the sum of the states of the neighbours of every cell of the board without the halo.
+
+        '''
+        if tuple(self.neighbours) != self.original or padded.ndim != self.dim or width < self.length:
+            return super().totals(padded, width)
+        if self.cost(self.length, self.dim) >= len(self.neighbours):
+            return super().totals(padded, width)
+        return self.diamondsum(padded, width, self.length, self.dim).astype(np.int32)
+
+    def cost(self, length : int, dim : int) -> int:
+        '''
+        estimates the cost of diamondsum, counted in additions of a shifted board.
+            Splitting into slices is counted half again, for the copies it makes.
+
+        Parameters
+        ----------
+        length : int
+            the largest Manhattan distance of the cells that are added.
+        dim : int
+            the number of axes along which is added.
+
+        Returns
+        -------
+        int
+            the estimated cost.
+
+        '''
+        if dim == 1:
+            return min(2 * length + 1, self.runningcost)
+        sliced = 1.5 * (sum([self.cost(radius, dim - 1) for radius in range(length + 1)]) + 2 * length + 1)
+        if dim == 2:
+            return min(sliced, self.diagonalcost)
+        return sliced
+
+    def diamondsum(self, padded : np.array, width : int, length : int, dim : int) -> np.array:
+        '''
+        adds up the states of the cells within a Manhattan distance along the last axes.
+            The diamond is split into slices of one dimension less, which are
+            added up with running sums in 1 dimension. In 2 dimensions diagonal
+            prefix sums are used instead when they are cheaper, their cost doesn't
+            depend on length. In 3 or more dimensions the cost per cell still grows
+            with length, as 2 * length + 1 slices are added on every level.
+
+        Parameters
+        ----------
+        padded : np.array
+            the states of the cells, surrounded by a halo along the last dim axes.
+        width : int
+            the width of the halo, at least length.
+        length : int
+            the largest Manhattan distance of the cells that are added.
+        dim : int
+            the number of axes along which is added.
+
+        Returns
+        -------
+        np.array
+            the sums for the cells without the halo.
+
+        '''
+        if dim == 1:
+            return self.runningsum(padded, -1, width, length)
+        if dim == 2 and self.cost(length, 2) == self.diagonalcost:
+            return self.diagonalsum(padded, width, length)
+        axis = padded.ndim - dim
+        cells = padded.shape[axis] - 2 * width
+        slices = {}
+        totals = None
+        for shift in range(-length, length + 1):
+            if length - abs(shift) not in slices:
+                slices[length - abs(shift)] = self.diamondsum(padded, width, length - abs(shift), dim - 1)
+            part = slices[length - abs(shift)][(slice(None),) * axis + (slice(width + shift, width + shift + cells),)]
+            if totals is None:
+                totals = part.copy()
+            else:
+                totals += part
+        return totals
+
+    def diagonalsum(self, padded : np.array, width : int, length : int) -> np.array:
+        '''
+        adds up the states of the cells within a Manhattan distance along the
+            last 2 axes. Every row of the diamond is a difference of row prefix
+            sums, and those lie on two diagonals, so prefix sums of the row prefix
+            sums along both diagonals give the diamond in a fixed number of steps.
+
+        Parameters
+        ----------
+        padded : np.array
+            the states of the cells, surrounded by a halo along the last 2 axes.
+        width : int
+            the width of the halo, at least length.
+        length : int
+            the largest Manhattan distance of the cells that are added.
+
+        Returns
+        -------
+        np.array
+            the sums for the cells without the halo.
+
+        '''
+        rows, columns = padded.shape[-2:]
+        if rows > columns:
+            return np.swapaxes(self.diagonalsum(np.swapaxes(padded, -1, -2), width, length), -1, -2)
+        batch = padded.shape[:-2]
+        prefix = np.zeros(batch + (rows, columns + 3), np.int64)
+        np.cumsum(padded, -1, out = prefix[..., 2:columns + 2])
+        rising = np.zeros(batch + (rows + 1, columns + 3), np.int64)
+        falling = np.zeros(batch + (rows + 1, columns + 3), np.int64)
+        for row in range(rows):
+            np.add(prefix[..., row, :-1], rising[..., row, 1:], out = rising[..., row + 1, :-1])
+            rising[..., row + 1, -1] = prefix[..., row, -1]
+            np.add(prefix[..., row, 1:], falling[..., row, :-1], out = falling[..., row + 1, 1:])
+            falling[..., row + 1, 0] = prefix[..., row, 0]
+        def shifted(sums : np.array, down : int, right : int) -> np.array:
+            return sums[..., width + down + 1 : rows - width + down + 1, width + right + 1 : columns - width + right + 1]
+        below = shifted(rising, length, 1) - shifted(rising, -1, length + 2) - shifted(falling, length, 0) + shifted(falling, -1, -length - 1)
+        above = shifted(falling, -1, length) - shifted(falling, -length - 1, 0) - shifted(rising, -1, 1 - length) + shifted(rising, -length - 1, 1)
+        return below + above
+
+    def __str__(self) -> str:
+        '''
+        returns a readable description of the instance
+
+        Returns
+        -------
+        str
+            the readable description.
+
+        '''
+        return f'Neumann({self.dim},{self.length})'
+
+
+class Blockrule:
+    def __init__(self, f = None, dim : int = None, states : int = None) -> None:
+        '''
+        creates an instance of this class, a rule for margolus block automata
+
+        Parameters
+        ----------
+        f : any type
+            function which takes a tuple of the states of the cells in a block,
+                and returns a tuple with their next states. The cells of a block
+                are ordered like np.ndindex((2,) * dim).
+        dim : int, optional
+            The number of dimensions of the blocks. The default is 2.
+        states : int, optional
+            The number of possible states of a cell. The default is 2.
+
+        Raises
+        ------
+        ValueError
+            dim cannot be lower than 1, there must be at least 2 states,
+                and f must give a valid block for every block.
+
+        TypeError
+            f needs to be a function.
+
+        Returns
+        -------
+        None.
+
+        '''
+        if not dim:
+            dim = 2
+        if dim < 1:
+            raise ValueError('a block needs at least one dimension')
+        if not states:
+            states = 2
+        if states < 2:
+            raise ValueError('a cell needs at least 2 possible states')
+        if not callable(f):
+            raise TypeError('the next state function of a block rule must be a function')
+        self.f = f
+        self.dim = dim
+        self.states = states
+        size = 2 ** dim
+        table = np.zeros((states ** size, size), np.int32)
+        for code, block in enumerate(itertools.product(range(states), repeat = size)):
+            newblock = tuple(f(block))
+            if len(newblock) != size:
+                raise ValueError('the next state function must give as many states as there are cells in a block')
+            if any([not 0 <= state < states for state in newblock]):
+                raise ValueError('the next state function gave a state that doesn\'t exist')
+            table[code] = newblock
+        self.table = table
+        self.weights = states ** np.arange(size - 1, -1, -1)
+
+    def __call__(self, block : tuple) -> tuple:
+        '''
+        determines what to do when an instance is called
+
+        Parameters
+        ----------
+        block : tuple
+            the states of the cells of a block.
+
+        Raises
+        ----------
+        ValueError
+            The size of the block needs to match with the dimension of the rule.
+
+        Returns
+        -------
+        tuple
+            next states of the cells of the block.
+
+        '''
+        if len(block) != 2 ** self.dim:
+            raise ValueError('The size of the block doesn\'t match with the dimension of the rule')
+        return tuple(self.table[np.dot(block, self.weights)])
+
+    def apply(self, blocks : np.array) -> np.array:
+        '''
+        determines the next states of many blocks at once using the lookup table
+
+        Parameters
+        ----------
+        blocks : np.array
+            array with one block per row.
+
+        Raises
+        ----------
+        ValueError
+            A block contains a state that doesn't exist.
+
+        Returns
+        -------
+        np.array
+            the next states of the blocks, one block per row.
+
+        '''
+        if blocks.size and (blocks.min() < 0 or blocks.max() >= self.states):
+            raise ValueError('a block contains a state that doesn\'t exist for this rule')
+        return self.table[blocks @ self.weights]
+
+    def __str__(self) -> str:
+        '''
+        returns a readable description of the instance
+
+        Returns
+        -------
+        str
+            the readable description.
+
+        '''
+        return f'block rule using function {self.f} on {self.dim}-dimensional blocks with {self.states} states'
+
+    def __repr__(self) -> str:
+        '''
+        returns a complete representation of the instance
+
+        Returns
+        -------
+        str
+            the complete representation.
+
+        '''
+        return f'blockrule({self.f},{self.dim},{self.states})'
+
+class Stochastic(Rule):
+    def __init__(self, neighbourhood : Neighbourhood, f = None, seed : int = None, cache : int = None, eviction : str = None) -> None:
+        '''
+        creates an instance of this class, a rule with random transitions
+
+        Parameters
+        ----------
+        neighbourhood : Neighbourhood
+            the neighbourhood of a generic cell.
+        f : any type
+            function which takes a tuple of states of the neighbours,
+                and returns the probabilities of every next state.
+        seed : int, optional
+            the seed of the random number generator. The default is a random seed.
+        cache : int, optional
+            the number of probabilities that are remembered. The default is None.
+        eviction : str, optional
+            'lru' or 'lfu', which remembered result is forgotten first. The default is 'lru'.
+
+        Returns
+        -------
+        None.
+
+        '''
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        super().__init__(neighbourhood, f, cache, eviction)
+
+    def __call__(self, neighbours : tuple) -> int:
+        '''
+        determines what to do when an instance is called
+
+        Parameters
+        ----------
+        neighbours : tuple
+            list of states of the neighbours.
+
+        Returns
+        -------
+        int
+            randomly chosen next state of the cell.
+
+        '''
+        probabilities = np.cumsum(super().__call__(neighbours))
+        return int(min(np.searchsorted(probabilities, self.rng.random(), 'right'), len(probabilities) - 1))
+
+    def apply(self, neighbours : np.array) -> np.array:
+        '''
+        determines the next states of many cells at once,
+            the random numbers for all cells are drawn together
+
+        Parameters
+        ----------
+        neighbours : np.array
+            array with the states of the n-th neighbour of every cell at index n.
+
+        Returns
+        -------
+        np.array
+            the randomly chosen next states of the cells.
+
+        '''
+        probabilities = np.cumsum(self.evaluate(neighbours), -1)
+        draws = self.rng.random(probabilities.shape[:-1])
+        states = (draws[..., None] >= probabilities).sum(-1)
+        return np.minimum(states, probabilities.shape[-1] - 1).astype(np.int32)
+
+    def stays(self, result, state : int) -> bool:
+        '''
+        determines whether probabilities given by the next state function
+            certainly keep a cell in its state
+
+        Parameters
+        ----------
+        result : any type
+            the probabilities of every next state.
+        state : int
+            the state of the cell.
+
+        Returns
+        -------
+        bool
+            whether the cell certainly stays in the state.
+
+        '''
+        return 0 <= state < len(result) and result[state] == 1
+
+    def __str__(self) -> str:
+        '''
+        returns a readable description of the instance
+
+        Returns
+        -------
+        str
+            the readable description.
+
+        '''
+        return f'stochastic rule using function {self.f} and neighbourhood {self.neighbourhood}, seed = {self.seed}'
+
+    def __repr__(self) -> str:
+        '''
+        returns a complete representation of the instance
+
+        Returns
+        -------
+        str
+            the complete representation.
+
+        '''
+        return f'stochastic({self.f},{self.neighbourhood},{self.seed})'
+
+class Schedule:
+    def __init__(self, seed : int = None) -> None:
+        '''
+        creates an instance of this class, the synchronous update schedule
+            in which all cells are updated at once
+
+        Parameters
+        ----------
+        seed : int, optional
+            the seed of the random number generator. The default is a random seed.
+
+        Returns
+        -------
+        None.
+
+        '''
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+
+    def __call__(self, board : Board, rule : Rule) -> None:
+        '''
+        updates every cell of the board once
+
+        Parameters
+        ----------
+        board : Board
+            the board to be updated.
+        rule : Rule
+            the rule with which the next states are to be determined.
+
+        Returns
+        -------
+        None
+
+        '''
+        board.cells = board.nextcells(rule)
+
+    def update(self, board : Board, rule : Rule, index : tuple) -> None:
+        '''
+        updates some of the cells of the board at once
+
+        Parameters
+        ----------
+        board : Board
+            the board to be updated.
+        rule : Rule
+            the rule with which the next states are to be determined.
+        index : tuple
+            one integer array per dimension with the adresses of the cells.
+
+        Returns
+        -------
+        None
+
+        '''
+        if len(index[0]):
+            board.cells[index] = rule.apply(board.neighbourarrays(index, rule.neighbourhood))
+
+    def layers(self, board : Board, neighbourhood : Neighbourhood) -> np.array:
+        '''
+        orders the cells randomly and groups them into layers, so that no cell
+            depends on a cell in the same layer and updating the layers one by one
+            is the same as updating the cells one by one in the random order.
+
+        Parameters
+        ----------
+        board : Board
+            the board whose cells are to be ordered.
+        neighbourhood : Neighbourhood
+            the neighbourhood that determines which cells depend on each other.
+
+        Returns
+        -------
+        np.array
+            the layer of every cell.
+
+        '''
+        shape = board.cells.shape
+        priority = self.rng.permutation(board.cells.size)
+        cells = np.arange(board.cells.size)
+        index = np.unravel_index(cells, shape)
+        sources = []
+        targets = []
+        for reladress in neighbourhood:
+            constant, forwardadress = board.edgerules.resolve(tuple([index[i] + reladress[i] for i in range(len(shape))]), shape)
+            target = np.ravel_multi_index(forwardadress, shape)
+            keep = ~constant & (target != cells)
+            sources += [cells[keep]]
+            targets += [target[keep]]
+        sources = np.concatenate(sources)
+        targets = np.concatenate(targets)
+        first = priority[sources] < priority[targets]
+        earlier = np.where(first, sources, targets)
+        later = np.where(first, targets, sources)
+        layer = np.zeros(board.cells.size, int)
+        while True:
+            newlayer = layer.copy()
+            np.maximum.at(newlayer, later, layer[earlier] + 1)
+            if (newlayer == layer).all():
+                return layer.reshape(shape)
+            layer = newlayer
+
+    def __str__(self) -> str:
+        '''
+        returns a readable description of the instance
+
+        Returns
+        -------
+        str
+            the readable description.
+
+        '''
+        return 'synchronous schedule'
+
+    def __repr__(self) -> str:
+        '''
+        returns a complete representation of the instance
+
+        Returns
+        -------
+        str
+            the complete representation.
+
+        '''
+        return f'{type(self).__name__.lower()}({self.seed})'
+
+class Randomsequential(Schedule):
+    def __call__(self, board : Board, rule : Rule) -> None:
+        '''
+        updates every cell of the board once, one by one in a random order.
+            Cells that don't depend on each other are updated together.
+
+        Parameters
+        ----------
+        board : Board
+            the board to be updated.
+        rule : Rule
+            the rule with which the next states are to be determined.
+
+        Returns
+        -------
+        None
+
+        '''
+        board.cells = board.cells.copy()
+        layer = self.layers(board, rule.neighbourhood).ravel()
+        order = np.argsort(layer, kind = 'stable')
+        bounds = np.cumsum(np.bincount(layer))[:-1]
+        for group in np.split(order, bounds):
+            self.update(board, rule, np.unravel_index(group, board.cells.shape))
+
+    def __str__(self) -> str:
+        '''
+        returns a readable description of the instance
+
+        Returns
+        -------
+        str
+            the readable description.
+
+        '''
+        return f'random sequential schedule, seed = {self.seed}'
+
+class Colouring(Schedule):
+    def __init__(self, seed : int = None, shuffle : bool = None) -> None:
+        '''
+        creates an instance of this class, the schedule that updates the cells
+            one colour class at a time, where no two cells of the same colour
+            are neighbours
+
+        Parameters
+        ----------
+        seed : int, optional
+            the seed of the random number generator. The default is a random seed.
+        shuffle : bool, optional
+            whether the order of the colours is shuffled every step. The default is True.
+
+        Returns
+        -------
+        None.
+
+        '''
+        if shuffle == None:
+            shuffle = True
+        self.shuffle = shuffle
+        self.key = None
+        self.colouring = None
+        super().__init__(seed)
+
+    def colours(self, board : Board, neighbourhood : Neighbourhood) -> np.array:
+        '''
+        gives every cell a colour such that no cell reads a cell of the same colour.
+            A checkerboard-like colouring a . x mod m is used when it fits the board,
+            otherwise the cells are coloured randomly.
+
+        Parameters
+        ----------
+        board : Board
+            the board whose cells are to be coloured.
+        neighbourhood : Neighbourhood
+            the neighbourhood that determines which cells depend on each other.
+
+        Returns
+        -------
+        np.array
+            the colour of every cell.
+
+        '''
+        key = (board.cells.shape, tuple(neighbourhood), str(board.edgerules))
+        if key == self.key:
+            return self.colouring
+        shape = board.cells.shape
+        dim = len(shape)
+        offsets = set()
+        for reladress in neighbourhood:
+            if any(reladress):
+                offsets |= {tuple(reladress), tuple([-coordinate for coordinate in reladress])}
+        differences = np.array(sorted(offsets), int).reshape(-1, dim)
+        base = 2 * neighbourhood.radius() + 1
+        modulus = base ** dim
+        coefficients = base ** np.arange(dim)
+        for m in range(2, modulus):
+            if m ** (dim - 1) > 100000:
+                break
+            candidates = np.array(list(itertools.product(range(m), repeat = dim - 1)), int).reshape(m ** (dim - 1), dim - 1)
+            candidates = np.hstack([np.ones((len(candidates), 1), int), candidates])
+            valid = ((candidates @ differences.T) % m != 0).all(1)
+            if valid.any():
+                modulus = m
+                coefficients = candidates[np.argmax(valid)]
+                break
+        index = np.indices(shape)
+        colouring = np.tensordot(coefficients, index, 1) % modulus
+        for reladress in offsets:
+            constant, forwardadress = board.edgerules.resolve(tuple([index[i] + reladress[i] for i in range(dim)]), shape)
+            itself = np.all([forwardadress[i] == index[i] for i in range(dim)], 0)
+            if (~constant & ~itself & (colouring[forwardadress] == colouring)).any():
+                colouring = self.layers(board, neighbourhood)
+                break
+        self.key = key
+        self.colouring = colouring
+        return colouring
+
+    def __call__(self, board : Board, rule : Rule) -> None:
+        '''
+        updates every cell of the board once, one colour at a time
+
+        Parameters
+        ----------
+        board : Board
+            the board to be updated.
+        rule : Rule
+            the rule with which the next states are to be determined.
+
+        Returns
+        -------
+        None
+
+        '''
+        board.cells = board.cells.copy()
+        colouring = self.colours(board, rule.neighbourhood)
+        order = np.unique(colouring)
+        if self.shuffle:
+            order = self.rng.permutation(order)
+        for colour in order:
+            self.update(board, rule, np.nonzero(colouring == colour))
+
+    def __str__(self) -> str:
+        '''
+        returns a readable description of the instance
+
+        Returns
+        -------
+        str
+            the readable description.
+
+        '''
+        return f'colouring schedule, shuffle = {self.shuffle}, seed = {self.seed}'
+
+class Probabilistic(Schedule):
+    def __init__(self, p : float = None, seed : int = None) -> None:
+        '''
+        creates an instance of this class, the schedule in which every cell
+            is updated with a fixed probability
+
+        Parameters
+        ----------
+        p : float, optional
+            the probability that a cell is updated. The default is 0.5.
+        seed : int, optional
+            the seed of the random number generator. The default is a random seed.
+
+        Raises
+        ------
+        ValueError
+            p must be a probability.
+
+        Returns
+        -------
+        None.
+
+        '''
+        if p == None:
+            p = 0.5
+        if not 0 <= p <= 1:
+            raise ValueError('the update probability must lie between 0 and 1')
+        self.p = p
+        super().__init__(seed)
+
+    def __call__(self, board : Board, rule : Rule) -> None:
+        '''
+        updates the randomly chosen cells of the board at once
+
+        Parameters
+        ----------
+        board : Board
+            the board to be updated.
+        rule : Rule
+            the rule with which the next states are to be determined.
+
+        Returns
+        -------
+        None
+
+        '''
+        board.cells = board.cells.copy()
+        self.update(board, rule, np.nonzero(self.rng.random(board.cells.shape) < self.p))
+
+    def __str__(self) -> str:
+        '''
+        returns a readable description of the instance
+
+        Returns
+        -------
+        str
+            the readable description.
+
+        '''
+        return f'probabilistic schedule, p = {self.p}, seed = {self.seed}'
+
+    def __repr__(self) -> str:
+        '''
+        returns a complete representation of the instance
+
+        Returns
+        -------
+        str
+            the complete representation.
+
+        '''
+        return f'probabilistic({self.p}, {self.seed})'
+
+class Renderer:
+    def __init__(self, palette : list = None, characters : str = None) -> None:
+        '''
+        creates an instance of this class, which turns boards into pictures
+
+        Parameters
+        ----------
+        palette : list, optional
+            the (red, green, blue) colour of every state. The default is
+                black for 0 and white for 1.
+        characters : str, optional
+            the character of every state in text pictures. The default is ' #'.
+
+        Raises
+        ------
+        ValueError
+            The colours need 3 channels between 0 and 255.
+
+        Returns
+        -------
+        None.
+
+        '''
+        if palette == None:
+            palette = [(0, 0, 0), (255, 255, 255)]
+        if characters == None:
+            characters = ' #'
+        palette = np.array(palette)
+        if palette.ndim != 2 or palette.shape[1] != 3 or palette.min() < 0 or palette.max() > 255:
+            raise ValueError('every colour of the palette needs a red, green and blue value between 0 and 255')
+        self.palette = palette.astype(np.uint8)
+        self.characters = np.array(list(characters))
+
+    def plane(self, cells : np.array) -> np.array:
+        '''
+        gives the cells as a 2 dimensional array, a 1 dimensional board is one row
+
+        Parameters
+        ----------
+        cells : np.array
+            the states of the cells.
+
+        Raises
+        ----------
+        ValueError
+            Only boards of 1 or 2 dimensions can be drawn.
+
+        Returns
+        -------
+        np.array
+            the states of the cells as rows and columns.
+
+        '''
+        if cells.ndim == 1:
+            return cells[None, :]
+        if cells.ndim != 2:
+            raise ValueError('only boards of 1 or 2 dimensions can be drawn')
+        return cells
+
+    def pool(self, cells : np.array, size : tuple = None, mode : str = None) -> np.array:
+        '''
+        shrinks a picture by combining blocks of cells into one cell
+
+        Parameters
+        ----------
+        cells : np.array
+            the picture, the first two axes are the rows and columns.
+        size : tuple, optional
+            the largest number of rows and columns of the result. The default
+                is the size of the picture.
+        mode : str, optional
+            how a block is combined, 'max' gives the largest state, 'mean'
+                the average and 'any' a 1 when any cell isn't 0. The default is 'max'.
+                Blocks at the bottom and right edge may be smaller, 'mean'
+                averages only over their cells.
+
+        Raises
+        ----------
+        ValueError
+            The mode must be 'max', 'mean' or 'any' and the size must be positive.
+
+        Returns
+        -------
+        np.array
+            the shrunk picture.
+
+        '''
+        if mode == None:
+            mode = 'max'
+        if mode not in ['max', 'mean', 'any']:
+            raise ValueError('the mode must be either \'max\', \'mean\' or \'any\'')
+        if size == None:
+            size = cells.shape[:2]
+        if any([length < 1 for length in size]):
+            raise ValueError('a picture must have a positive size')
+        factors = [-(-cells.shape[i] // size[i]) for i in range(2)]
+        if factors == [1, 1]:
+            return (cells != 0).astype(np.int32) if mode == 'any' else cells
+        counts = [-(-cells.shape[i] // factors[i]) for i in range(2)]
+        padding = [(0, counts[i] * factors[i] - cells.shape[i]) for i in range(2)] + [(0, 0)] * (cells.ndim - 2)
+        if mode != 'mean':
+            blocks = np.pad(cells, padding, 'edge').reshape((counts[0], factors[0], counts[1], factors[1]) + cells.shape[2:])
+            if mode == 'max':
+                return blocks.max((1, 3))
+            return (blocks != 0).any((1, 3)).astype(np.int32)
+        blocks = np.pad(cells, padding).reshape((counts[0], factors[0], counts[1], factors[1]) + cells.shape[2:])
+        rows = np.minimum(factors[0], cells.shape[0] - factors[0] * np.arange(counts[0]))
+        columns = np.minimum(factors[1], cells.shape[1] - factors[1] * np.arange(counts[1]))
+        sizes = np.outer(rows, columns).reshape(tuple(counts) + (1,) * (cells.ndim - 2))
+        return blocks.sum((1, 3)) / sizes
+
+    def frame(self, cells : np.array, size : tuple = None, mode : str = None) -> np.array:
+        '''
+        turns the cells into a colour picture using the palette
+
+        Parameters
+        ----------
+        cells : np.array
+            the states of the cells.
+        size : tuple, optional
+            the largest number of rows and columns of the picture. The default is the size of the board.
+        mode : str, optional
+            how blocks of cells are combined when the board is too large,
+                see pool. The default is 'max'.
+
+        Raises
+        ----------
+        ValueError
+            Every state needs a colour in the palette.
+
+        Returns
+        -------
+        np.array
+            the picture, with a red, green and blue value for every pixel.
+
+        '''
+        cells = self.plane(cells)
+        if cells.size and (cells.min() < 0 or cells.max() >= len(self.palette)):
+            raise ValueError('the palette doesn\'t have a colour for every state')
+        if mode == 'mean':
+            return np.rint(self.pool(self.palette[cells].astype(float), size, mode)).astype(np.uint8)
+        return self.palette[self.pool(cells, size, mode)]
+
+    def ascii(self, cells : np.array, size : tuple = None, mode : str = None) -> str:
+        '''
+        turns the cells into a text picture
+
+        Parameters
+        ----------
+        cells : np.array
+            the states of the cells.
+        size : tuple, optional
+            the largest number of rows and columns of the picture. The default is the size of the board.
+        mode : str, optional
+            how blocks of cells are combined when the board is too large,
+                see pool. The default is 'max'.
+
+        Raises
+        ----------
+        ValueError
+            Every state needs a character.
+
+        Returns
+        -------
+        str
+            the picture, one line per row.
+
+        '''
+        cells = np.rint(self.pool(self.plane(cells), size, mode)).astype(int)
+        if cells.size and (cells.min() < 0 or cells.max() >= len(self.characters)):
+            raise ValueError('there isn\'t a character for every state')
+        return '\n'.join([''.join(row) for row in self.characters[cells]])
+
+    def encode(self, frame : np.array, kind : str = None) -> bytes:
+        '''
+        turns a colour picture into the bytes of an image file
+
+        Parameters
+        ----------
+        frame : np.array
+            the picture, as given by frame.
+        kind : str, optional
+            the file format, 'pgm' (grey), 'ppm' or 'png'. The default is 'png'.
+
+        Raises
+        ----------
+        ValueError
+            The file format must be 'pgm', 'ppm' or 'png'.
+
+        Returns
+        -------
+        bytes
+            the image file.
+
+        '''
+        if kind == None:
+            kind = 'png'
+        rows, columns = frame.shape[:2]
+        if kind == 'pgm':
+            grey = np.rint(frame @ np.array([0.299, 0.587, 0.114])).astype(np.uint8)
+            return f'P5\n{columns} {rows}\n255\n'.encode() + grey.tobytes()
+        if kind == 'ppm':
+            return f'P6\n{columns} {rows}\n255\n'.encode() + np.ascontiguousarray(frame).tobytes()
+        if kind != 'png':
+            raise ValueError('the file format must be either \'pgm\', \'ppm\' or \'png\'')
+        scanlines = np.zeros((rows, 1 + 3 * columns), np.uint8)
+        scanlines[:, 1:] = frame.reshape(rows, 3 * columns)
+        def chunk(name : bytes, data : bytes) -> bytes:
+            return struct.pack('>I', len(data)) + name + data + struct.pack('>I', zlib.crc32(name + data))
+        return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', columns, rows, 8, 2, 0, 0, 0))
+                + chunk(b'IDAT', zlib.compress(scanlines.tobytes())) + chunk(b'IEND', b''))
+
+    def save(self, cells : np.array, path : str, size : tuple = None, mode : str = None) -> None:
+        '''
+        writes the cells to an image file, the format follows from the extension
+
+        Parameters
+        ----------
+        cells : np.array
+            the states of the cells.
+        path : str
+            the name of the file, ending in .pgm, .ppm, .png or .txt.
+        size : tuple, optional
+            the largest number of rows and columns of the picture. The default is the size of the board.
+        mode : str, optional
+            how blocks of cells are combined when the board is too large,
+                see pool. The default is 'max'.
+
+        Returns
+        -------
+        None
+
+        '''
+        kind = path.rsplit('.', 1)[-1].lower()
+        if kind == 'txt':
+            data = (self.ascii(cells, size, mode) + '\n').encode()
+        else:
+            data = self.encode(self.frame(cells, size, mode), kind)
+        with open(path, 'wb') as file:
+            file.write(data)
+
+    def __str__(self) -> str:
+        '''
+        returns a readable description of the instance
+
+        Returns
+        -------
+        str
+            the readable description.
+
+        '''
+        return f'renderer with {len(self.palette)} colours and characters {repr("".join(self.characters))}'
+
+    def __repr__(self) -> str:
+        '''
+        returns a complete representation of the instance
+
+        Returns
+        -------
+        str
+            the complete representation.
+
+        '''
+        return f'renderer({self.palette.tolist()}, {repr("".join(self.characters))})'
+
+class Framewriter:
+    def __init__(self, renderer : Renderer = None, pattern : str = None, size : tuple = None, mode : str = None, backlog : int = None) -> None:
+        '''
+        creates an instance of this class, which writes pictures of boards to
+            files in a background thread, so stepping can go on while the
+            pictures are encoded
+
+        Parameters
+        ----------
+        renderer : Renderer, optional
+            the renderer that draws the pictures. The default is Renderer().
+        pattern : str, optional
+            the name of the files, {} is replaced by the generation.
+                The default is 'frame{:06d}.png'.
+        size : tuple, optional
+            the largest number of rows and columns of the pictures.
+        mode : str, optional
+            how blocks of cells are combined when the board is too large, see Renderer.pool.
+        backlog : int, optional
+            the largest number of pictures waiting to be written, adding a picture
+                waits when there are more. The default is 16.
+
+        Returns
+        -------
+        None.
+
+        '''
+        if renderer == None:
+            renderer = Renderer()
+        if pattern == None:
+            pattern = 'frame{:06d}.png'
+        if backlog == None:
+            backlog = 16
+        self.renderer = renderer
+        self.pattern = pattern
+        self.size = size
+        self.mode = mode
+        self.frames = queue.Queue(backlog)
+        self.error = None
+        self.thread = threading.Thread(target = self.work, daemon = True)
+        self.thread.start()
+
+    def work(self) -> None:
+        '''
+        writes the waiting pictures until None is put in the queue
+
+        Returns
+        -------
+        None
+
+        '''
+        while True:
+            item = self.frames.get()
+            if item == None:
+                return
+            generation, cells = item
+            try:
+                self.renderer.save(cells, self.pattern.format(generation), self.size, self.mode)
+            except Exception as error:
+                if self.error == None:
+                    self.error = error
+
+    def write(self, board : Board) -> None:
+        '''
+        adds a picture of the current state of a board to the queue
+
+        Parameters
+        ----------
+        board : Board
+            the board to be drawn.
+
+        Raises
+        ----------
         ValueError
-            dim cannot be lower than 1, and length cannot be lower than 0.
+            The writer has been closed.
 
         Returns
         -------
         None
 
         '''
-        if not dim:
-            dim = 2
-        if dim < 1:
-            raise ValueError
-        if length == None:
-            length = 1
-        if length < 0:
-            raise ValueError
-        self.dim = dim
-        self.length = length
-        neighbours = [[]]
-        for _ in range(dim):
-            for number in range(len(neighbours)):
-                current_house = neighbours[number]
-                neighbours[number] = current_house + [0]
-                for d in range(1, length + 1):
-                    neighbours += [current_house + [d], current_house + [-d]]
-        for number in range(len(neighbours)):
-            neighbours[number] = tuple(neighbours[number])
-        
-        super().__init__(neighbours)
+        if not self.thread.is_alive():
+            raise ValueError('the frame writer has been closed')
+        self.frames.put((board.generation, board.cells.copy()))
+
+    def close(self) -> None:
+        '''
+        waits until all pictures have been written and stops the thread
+
+        Raises
+        ----------
+        Exception
+            The first error raised while writing a picture.
+
+        Returns
+        -------
+        None
+
+        '''
+        self.finish()
+        if self.error != None:
+            raise self.error
+
+    def finish(self) -> None:
+        '''
+        waits until all pictures have been written and stops the thread,
+            without raising the errors of the writes
+
+        Returns
+        -------
+        None
+
+        '''
+        if self.thread.is_alive():
+            self.frames.put(None)
+            self.thread.join()
+
+    def __enter__(self) -> 'Framewriter':
+        '''
+        starts a with block
+
+        Returns
+        -------
+        Framewriter
+            the instance itself.
+
+        '''
+        return self
+
+    def __exit__(self, *exception) -> None:
+        '''
+        ends a with block by closing the writer. When the block is left by an
+            exception, the errors of the writes are not raised on top of it.
+
+        Returns
+        -------
+        None
+
+        '''
+        if exception[0] is None:
+            self.close()
+        else:
+            self.finish()
 
     def __str__(self) -> str:
         '''
@@ -693,54 +3157,231 @@ class Moorehood(Neighbourhood):
             the readable description.
 
         '''
-        return f'moore({self.dim},{self.length})'
+        return f'frame writer to {self.pattern} using {self.renderer}'
 
-class Neumannhood(Neighbourhood):
-    def __init__(self, dim : int = None, length : int = None) -> None:
+    def __repr__(self) -> str:
         '''
-        creates an instance of this class
+        returns a complete representation of the instance
+
+        Returns
+        -------
+        str
+            the complete representation.
+
+        '''
+        return f'framewriter({repr(self.renderer)}, {self.pattern}, {self.size}, {self.mode})'
+
+class Trajectory:
+    def __init__(self, board : Board, interval : int = None) -> None:
+        '''
+        creates an instance of this class, which records the generations of
+            a board. Every interval generations the whole board is stored,
+            in between only the cells that changed.
 
         Parameters
         ----------
-        dim : int, optional
-            The number of dimensions of the neighbourhood. The default is 2.
-        length : int, optional
-            The maximum Manhattan distance of cells in the neighbourhood.
-            The default is 1.
+        board : Board
+            the board to be recorded, its current state is the first recorded generation.
+        interval : int, optional
+            the number of recorded generations between two complete copies.
+                The default is 64.
 
         Raises
         ------
         ValueError
-            dim cannot be lower than 1, and length cannot be lower than 0.
+            interval needs to be positive.
+
+        Returns
+        -------
+        None.
+
+        '''
+        if interval == None:
+            interval = 64
+        if interval < 1:
+            raise ValueError('the interval between complete copies must be positive')
+        self.interval = interval
+        self.board = board
+        self.generations = []
+        self.origins = []
+        self.frames = []
+        self.last = None
+        self.record()
+
+    def record(self) -> None:
+        '''
+        stores the current state of the board
+
+        Raises
+        ----------
+        ValueError
+            The generation of the board must be later than the last recorded one.
+
+        Returns
+        -------
+        None
+
+        '''
+        if self.generations and self.board.generation <= self.generations[-1]:
+            raise ValueError('the board is not later than the last recorded generation')
+        cells = self.board.cells
+        if self.last is None or cells.shape != self.last.shape or len(self.generations) % self.interval == 0:
+            frame = cells.copy()
+        else:
+            changed = np.flatnonzero(cells != self.last)
+            index = changed.astype(np.uint32) if cells.size < 2 ** 32 else changed
+            frame = (index, cells.ravel()[changed])
+        self.generations += [self.board.generation]
+        self.origins += [self.board.origin]
+        self.frames += [frame]
+        self.last = cells.copy()
 
+    def advance(self, rule : Rule = None, steps : int = None) -> None:
+        '''
+        advances the board one step at a time and records every generation
+
+        Parameters
+        ----------
+        rule : Rule
+            the rule with which the next states of the board are to be determined.
+        steps : int, optional
+            the number of steps to be taken. The default is 1
+
+        Raises
+        ----------
+        ValueError
+            steps cannot be lower than 1.
 
         Returns
         -------
         None.
 
         '''
-        if not dim:
-            dim = 2
-        if dim < 1:
-            raise ValueError
-        if length == None:
-            length = 1
-        if length < 0:
-            raise ValueError
-        self.dim = dim
-        self.length = length
-        neighbours = [[]]
-        for _ in range(dim):
-            for number in range(len(neighbours)):
-                current_house = neighbours[number]
-                neighbours[number] = current_house + [0]
-                distance = sum([abs(coord) for coord in current_house])
-                for d in range(1, length - distance + 1):
-                    neighbours += [current_house + [d], current_house + [-d]]
-        for number in range(len(neighbours)):
-            neighbours[number] = tuple(neighbours[number])
-        
-        super().__init__(neighbours)
+        if not steps:
+            steps = 1
+        if steps < 1:
+            raise ValueError('You cannot make me go backwards, that goes against the second law of thermodynamics')
+        for _ in range(steps):
+            self.board.advance(rule)
+            self.record()
+
+    def position(self, generation : int) -> int:
+        '''
+        finds where a generation is stored
+
+        Parameters
+        ----------
+        generation : int
+            the generation.
+
+        Raises
+        ----------
+        KeyError
+            The generation has not been recorded.
+
+        Returns
+        -------
+        int
+            the number of the recorded generation.
+
+        '''
+        position = bisect.bisect_left(self.generations, generation)
+        if position == len(self.generations) or self.generations[position] != generation:
+            raise KeyError(f'generation {generation} has not been recorded')
+        return position
+
+    def __getitem__(self, generation : int) -> np.array:
+        '''
+        gives the states of the cells in a recorded generation, starting
+            from the last complete copy before it
+
+        Parameters
+        ----------
+        generation : int
+            the generation.
+
+        Returns
+        -------
+        np.array
+            the states of the cells.
+
+        '''
+        position = self.position(generation)
+        key = position
+        while type(self.frames[key]) == tuple:
+            key -= 1
+        cells = self.frames[key].copy()
+        flat = cells.reshape(-1)
+        for index, states in self.frames[key + 1 : position + 1]:
+            flat[index] = states
+        return cells
+
+    def seek(self, generation : int) -> Board:
+        '''
+        rebuilds the board as it was in a recorded generation
+
+        Parameters
+        ----------
+        generation : int
+            the generation.
+
+        Returns
+        -------
+        Board
+            a new board in that generation, which can be advanced further.
+
+        '''
+        board = Board(self[generation], self.board.edgerules, self.board.grow)
+        board.generation = generation
+        board.origin = self.origins[self.position(generation)]
+        return board
+
+    def resume(self, generation : int) -> Board:
+        '''
+        goes back to a recorded generation, forgetting the later generations,
+            so that recording goes on from there
+
+        Parameters
+        ----------
+        generation : int
+            the generation.
+
+        Returns
+        -------
+        Board
+            the rebuilt board, which is now the recorded board.
+
+        '''
+        board = self.seek(generation)
+        position = self.position(generation) + 1
+        del self.generations[position:], self.origins[position:], self.frames[position:]
+        self.board = board
+        self.last = board.cells.copy()
+        return board
+
+    def nbytes(self) -> int:
+        '''
+        returns the memory used by the stored generations
+
+        Returns
+        -------
+        int
+            the number of bytes.
+
+        '''
+        return sum([frame[0].nbytes + frame[1].nbytes if type(frame) == tuple else frame.nbytes for frame in self.frames])
+
+    def __len__(self) -> int:
+        '''
+        returns the number of recorded generations
+
+        Returns
+        -------
+        int
+            the number of recorded generations
+
+        '''
+        return len(self.generations)
 
     def __str__(self) -> str:
         '''
@@ -752,8 +3393,19 @@ class Neumannhood(Neighbourhood):
             the readable description.
 
         '''
-        return f'Neumann({self.dim},{self.length})'
+        return f'trajectory of generations {self.generations[0]} to {self.generations[-1]}, a complete copy every {self.interval} generations'
+
+    def __repr__(self) -> str:
+        '''
+        returns a complete representation of the instance
+
+        Returns
+        -------
+        str
+            the complete representation.
 
+        '''
+        return f'trajectory({repr(self.board)}, {self.interval})'
 
 class Automata(Board):
     def __init__(self, matrix : np.array, edgerules: Edgerule, rules : Rule) -> None:
@@ -30,8 +30,9 @@ testboard[1-1]=1
 testboard[4-1]=1
 testboard[5-1]=1
 testboard[7-1]=1
-print(testboard)
+renderer = Renderer()
+print(renderer.ascii(testboard.cells))
 
 while input('')!='exit':
     testboard.nextstate(rule30)
-    print(testboard)
+    print(renderer.ascii(testboard.cells))